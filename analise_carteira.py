@@ -1,11 +1,32 @@
-import pandas as pd
-import numpy as np
+import threading
 import tkinter as tk
 from tkinter import filedialog, messagebox, ttk
 
+# pandas e numpy são carregados em segundo plano depois que a janela aparece
+# (ver _carregar_bibliotecas). O xlsxwriter/openpyxl só são importados pelo
+# próprio pandas na leitura e na exportação da planilha.
+pd = None
+np = None
+
+# --- 0. CARREGAMENTO DAS BIBLIOTECAS PESADAS ---
+def _carregar_bibliotecas():
+    global pd, np
+    import pandas
+    import numpy
+    pd, np = pandas, numpy
+
+def _aguardar_bibliotecas():
+    # Espera o carregamento em segundo plano; se ele ainda não começou ou
+    # falhou, importa aqui para que o erro real apareça na thread principal.
+    if thread_bibliotecas.is_alive():
+        thread_bibliotecas.join()
+    if pd is None or np is None:
+        _carregar_bibliotecas()
+
 # --- 1. FUNÇÃO PRINCIPAL DA ANÁLISE ---
 def processar_dados(caminho_arquivo, gerente_selecionado, volume_minimo):
     try:
+        _aguardar_bibliotecas()
         df = pd.read_excel(caminho_arquivo, header=None)
 
         # Seleciona e nomeia as colunas pela posição
@@ -80,6 +101,7 @@ def selecionar_arquivo():
         entry_arquivo.config(state='readonly')
         
         try:
+            _aguardar_bibliotecas()
             df_temp = pd.read_excel(caminho, header=None) 
             gerentes = df_temp.iloc[1:, 3].dropna().unique().tolist()
             gerentes = sorted([str(g).strip() for g in gerentes if str(g).strip()])
@@ -193,4 +215,9 @@ entry_volume.insert(0, "28")
 btn_gerar = ttk.Button(frame, text="Gerar Relatório", command=gerar_relatorio, state='disabled')
 btn_gerar.grid(row=3, column=1, pady=20)
 
+# As bibliotecas pesadas começam a carregar só depois que a janela é desenhada,
+# enquanto o usuário escolhe o arquivo
+thread_bibliotecas = threading.Thread(target=_carregar_bibliotecas, daemon=True)
+root.after_idle(thread_bibliotecas.start)
+
 root.mainloop()
\ No newline at end of file
@@ -1,10 +1,15 @@
-import pandas as pd
-import numpy as np
 import streamlit as st
 import io
 
+# pandas e numpy são importados só quando necessários (dentro das funções e
+# depois do upload), para que a página apareça antes do carregamento. O
+# xlsxwriter só é carregado pelo pandas em to_excel, na hora da exportação.
+
 # --- FUNÇÃO PRINCIPAL DA ANÁLISE (A MESMA LÓGICA DE ANTES) ---
 def processar_dados(df_origem, gerente_selecionado, volume_minimo):
+    import pandas as pd
+    import numpy as np
+
     try:
         df_analysis = df_origem.iloc[:, [0, 3, 5, 9, 15, 24, 29]].copy()
         df_analysis.columns = ['FILIAL', 'GERENTE', 'PEDIDO', 'CLIENTE', 'LOTE', 'TON', 'ENTREGA']
@@ -58,6 +63,8 @@ def processar_dados(df_origem, gerente_selecionado, volume_minimo):
 
 # --- FUNÇÃO PARA GERAR O ARQUIVO EXCEL EM MEMÓRIA ---
 def to_excel(df):
+    import pandas as pd
+
     output = io.BytesIO()
     writer = pd.ExcelWriter(output, engine='xlsxwriter', datetime_format='dd/mm/yyyy')
     df.to_excel(writer, sheet_name='Análise de Pedidos', index=False)
@@ -103,6 +110,8 @@ uploaded_file = st.file_uploader("1. Carregue a planilha de carteira (.xlsm ou .
 
 if uploaded_file is not None:
     try:
+        import pandas as pd
+
         df_bruto = pd.read_excel(uploaded_file, header=None)
         
         st.sidebar.header("2. Defina os Filtros")
@@ -0,0 +1,173 @@
+"""Benchmark de tempo de inicialização dos aplicativos de relatório.
+
+Mede, sempre em processos novos (partida a frio do interpretador):
+  - o tempo de importação das bibliotecas pesadas;
+  - o tempo até a primeira janela do aplicativo Tk (analise_carteira.py);
+  - o tempo até a primeira renderização dos aplicativos Streamlit.
+
+Também verifica quais bibliotecas já estavam carregadas nesse primeiro
+momento: o xlsxwriter nunca deve estar, e o pandas não deve estar no
+Streamlit antes do upload da planilha.
+
+Uso:
+    python bench_startup.py
+    python bench_startup.py --repeticoes 10 --saida bench_startup.json
+    python bench_startup.py --referencia bench_startup.json --tolerancia 0.25
+
+Com --referencia, o script termina com código 1 se alguma medição ficar mais
+lenta que a referência além da tolerância, ou se uma biblioteca pesada for
+carregada antes da hora.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+PASTA = os.path.dirname(os.path.abspath(__file__))
+
+MODULOS_PESADOS = ['pandas', 'numpy', 'openpyxl', 'xlsxwriter', 'streamlit']
+
+APP_TK = 'analise_carteira.py'
+APPS_STREAMLIT = ['analise_carteiraSL.py', 'analise_carteiraSLV2.py', 'analise_carteiraSLV3.py']
+
+# Bibliotecas que não podem estar carregadas no primeiro quadro de cada tipo de app
+PROIBIDOS_TK = ['xlsxwriter', 'openpyxl']
+PROIBIDOS_STREAMLIT = ['pandas', 'numpy', 'xlsxwriter', 'openpyxl']
+
+# Executado no processo filho: importa o módulo e imprime a duração em segundos
+CODIGO_IMPORTACAO = """
+import time
+inicio = time.perf_counter()
+import {modulo}
+print(time.perf_counter() - inicio)
+"""
+
+# Executado no processo filho: troca o mainloop por um update() para saber quando
+# a janela foi desenhada, registra o horário e fecha o aplicativo.
+CODIGO_JANELA_TK = """
+import json, runpy, sys, time
+import tkinter as tk
+
+def primeira_janela(self, n=0):
+    self.update()
+    print(json.dumps({{'horario': time.time(), 'carregados': [m for m in {modulos!r} if m in sys.modules]}}))
+    self.destroy()
+
+tk.Tk.mainloop = primeira_janela
+runpy.run_path({caminho!r}, run_name='__main__')
+"""
+
+# Executado no processo filho: roda o script uma vez pelo AppTest, sem upload
+CODIGO_RENDER_STREAMLIT = """
+import json, sys, time
+from streamlit.testing.v1 import AppTest
+
+at = AppTest.from_file({caminho!r}).run(timeout=60)
+if at.exception:
+    raise SystemExit(str(at.exception[0].value))
+print(json.dumps({{'horario': time.time(), 'carregados': [m for m in {modulos!r} if m in sys.modules]}}))
+"""
+
+
+def _rodar(codigo):
+    resultado = subprocess.run([sys.executable, '-c', codigo], cwd=PASTA, capture_output=True, text=True)
+    if resultado.returncode != 0:
+        raise RuntimeError(resultado.stderr.strip().splitlines()[-1] if resultado.stderr.strip() else 'processo falhou')
+    return resultado.stdout.strip().splitlines()[-1]
+
+
+def medir_importacao(modulo, repeticoes):
+    tempos = [float(_rodar(CODIGO_IMPORTACAO.format(modulo=modulo))) for _ in range(repeticoes)]
+    return {'segundos': statistics.median(tempos)}
+
+
+def _medir_primeiro_quadro(codigo, repeticoes):
+    tempos = []
+    carregados = set()
+    for _ in range(repeticoes):
+        inicio = time.time()
+        dados = json.loads(_rodar(codigo))
+        tempos.append(dados['horario'] - inicio)
+        carregados.update(dados['carregados'])
+    return {'segundos': statistics.median(tempos), 'carregados': sorted(carregados)}
+
+
+def medir_janela_tk(repeticoes):
+    codigo = CODIGO_JANELA_TK.format(caminho=os.path.join(PASTA, APP_TK), modulos=MODULOS_PESADOS)
+    return _medir_primeiro_quadro(codigo, repeticoes)
+
+
+def medir_render_streamlit(app, repeticoes):
+    codigo = CODIGO_RENDER_STREAMLIT.format(caminho=os.path.join(PASTA, app), modulos=MODULOS_PESADOS)
+    return _medir_primeiro_quadro(codigo, repeticoes)
+
+
+def executar(repeticoes):
+    medicoes = {}
+    tarefas = [(f'importacao:{m}', [], lambda m=m: medir_importacao(m, repeticoes)) for m in MODULOS_PESADOS]
+    tarefas.append((f'primeira_janela:{APP_TK}', PROIBIDOS_TK, lambda: medir_janela_tk(repeticoes)))
+    for app in APPS_STREAMLIT:
+        tarefas.append((f'primeira_renderizacao:{app}', PROIBIDOS_STREAMLIT,
+                        lambda app=app: medir_render_streamlit(app, repeticoes)))
+
+    for nome, proibidos, medir in tarefas:
+        try:
+            medicao = medir()
+        except Exception as e:
+            # Falta de dependência ou de tela (DISPLAY) não impede as outras medições
+            medicoes[nome] = {'erro': str(e)}
+            print(f"{nome:<50} indisponível: {e}")
+            continue
+        medicao['adiantados'] = [m for m in medicao.get('carregados', []) if m in proibidos]
+        medicoes[nome] = medicao
+        aviso = f"  (carregados cedo: {', '.join(medicao['adiantados'])})" if medicao['adiantados'] else ''
+        print(f"{nome:<50} {medicao['segundos'] * 1000:>9.1f} ms{aviso}")
+    return medicoes
+
+
+def comparar(medicoes, referencia, tolerancia):
+    problemas = []
+    for nome, medicao in medicoes.items():
+        anterior = referencia.get(nome, {})
+        if 'erro' in medicao:
+            # Só é regressão se a referência conseguiu medir; falta de tela ou de
+            # dependência nos dois lados continua sendo ignorada
+            if 'segundos' in anterior:
+                problemas.append(f"{nome}: falhou ({medicao['erro']})")
+            continue
+        if medicao['adiantados']:
+            problemas.append(f"{nome}: bibliotecas carregadas antes da hora ({', '.join(medicao['adiantados'])})")
+        if 'segundos' in anterior and medicao['segundos'] > anterior['segundos'] * (1 + tolerancia):
+            problemas.append(f"{nome}: {medicao['segundos'] * 1000:.1f} ms contra {anterior['segundos'] * 1000:.1f} ms na referência")
+    return problemas
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Mede o tempo de inicialização dos aplicativos de relatório.")
+    parser.add_argument('--repeticoes', type=int, default=5, help="Processos novos por medição (usa a mediana).")
+    parser.add_argument('--saida', help="Arquivo JSON onde salvar as medições.")
+    parser.add_argument('--referencia', help="Arquivo JSON de uma execução anterior para comparar.")
+    parser.add_argument('--tolerancia', type=float, default=0.25, help="Piora relativa aceita em relação à referência.")
+    args = parser.parse_args()
+
+    medicoes = executar(args.repeticoes)
+
+    if args.saida:
+        with open(args.saida, 'w', encoding='utf-8') as arquivo:
+            json.dump(medicoes, arquivo, indent=2, ensure_ascii=False)
+
+    if args.referencia:
+        with open(args.referencia, encoding='utf-8') as arquivo:
+            referencia = json.load(arquivo)
+        problemas = comparar(medicoes, referencia, args.tolerancia)
+        for problema in problemas:
+            print(f"REGRESSÃO: {problema}")
+        return 1 if problemas else 0
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())